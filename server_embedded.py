@@ -1,19 +1,37 @@
 #!/usr/bin/env python3
 """Ultra-minimal API for HuggingFace model memory estimation.
 
-Zero framework overhead - uses only stdlib http.server + httpx.
+Zero framework overhead - uses only stdlib http.server + httpx + orjson.
 Embeds hf-mem logic directly to avoid subprocess overhead.
 """
 
-import json
+import asyncio
+import atexit
+import gzip
 import os
+import re
+import signal
+import socket
+import sqlite3
 import struct
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, OrderedDict
+from math import prod
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
 import httpx
+import orjson
+
+
+def json_dumps(data: dict) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2)
 
 PORT = int(os.environ.get("PORT", 8080))
+WORKERS = int(os.environ.get("WORKERS", os.cpu_count() or 1))
 HF_TOKEN = os.environ.get("HF_TOKEN")
 
 # Bytes per dtype for memory calculation
@@ -23,115 +41,456 @@ DTYPE_SIZES = {
     "I16": 2, "I8": 1, "U8": 1, "BOOL": 1,
 }
 
+# Characters rejected in model IDs (basic protection)
+_BAD_MODEL_CHARS = re.compile(r"[<>\"';&|]")
+
+# HF config.json torch_dtype -> safetensors dtype
+TORCH_DTYPES = {
+    "float64": "F64", "float32": "F32", "bfloat16": "BF16", "float16": "F16",
+}
+
+# Dense architectures that can be sized from config.json -> MLP projection count
+# (3 for gated MLPs). Anything else falls back to reading safetensors headers.
+CONFIG_ARCHITECTURES = {
+    "LlamaForCausalLM": 3, "MistralForCausalLM": 3, "Qwen2ForCausalLM": 3,
+    "GemmaForCausalLM": 3, "Gemma2ForCausalLM": 3,
+    "PhiForCausalLM": 2, "GPTNeoXForCausalLM": 2,
+}
+
+# Max in-flight shard header requests (multiplexed over one HTTP/2 connection)
+MAX_CONCURRENT_FETCHES = 20
+
+# Speculative first read per shard; covers the header of almost every safetensors file
+HEADER_PREFETCH_BYTES = 1024 * 1024
+
+# Headers larger than this are downloaded as parallel range requests
+LARGE_HEADER_BYTES = 4 * 1024 * 1024
+LARGE_HEADER_CHUNKS = 4
+
+# Static usage error, encoded once at import
+USAGE_BODY = json_dumps({"error": "Usage: /model?hf_id=microsoft/phi-2"})
+
+# Smaller bodies grow under gzip framing, so they are sent as-is
+GZIP_MIN_BYTES = 256
+
+# In-process result cache: (model_id, revision) -> (expires_at, result)
+CACHE_TTL = 3600
+CACHE_MAXSIZE = 1024
+_cache: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+_cache_lock = threading.Lock()
+_db_lock = threading.Lock()
+
+# On-disk copy of the result cache so restarts come up warm ("" disables it)
+CACHE_DB = os.environ.get("CACHE_DB", "cache.db")
+
+# File listings per (model_id, revision) with their ETag, revalidated via If-None-Match.
+# Only touched from the event loop thread, so no lock is needed.
+_tree_cache: dict[tuple[str, str], tuple[str, list]] = {}
+
+# Each worker process runs one event loop thread and one HTTP/2 client shared by
+# all of its requests, so connections to huggingface.co are reused across calls
+_default_headers = {"Accept": "application/json"}
+if HF_TOKEN:
+    _default_headers["Authorization"] = f"Bearer {HF_TOKEN}"
+
+# Per-process runtime, created by start_worker() (threads and sockets don't survive fork)
+_LOOP: asyncio.AbstractEventLoop | None = None
+_CLIENT: httpx.AsyncClient | None = None
+_db: sqlite3.Connection | None = None
+_start_lock = threading.Lock()
+
+
+def start_worker() -> None:
+    """Start this process's event loop thread, HTTP client and cache DB connection."""
+    global _LOOP, _CLIENT, _db
+    with _start_lock:
+        if _LOOP is not None:
+            return
+
+        if CACHE_DB:
+            try:
+                _db = sqlite3.connect(CACHE_DB, check_same_thread=False, isolation_level=None)
+                _db.execute("PRAGMA journal_mode=WAL")
+                _db.execute("PRAGMA synchronous=NORMAL")
+                _db.execute(
+                    "CREATE TABLE IF NOT EXISTS estimates ("
+                    "model_id TEXT, revision TEXT, ts INTEGER, body BLOB, PRIMARY KEY (model_id, revision))"
+                )
+            except sqlite3.Error as e:
+                # Run with the in-memory cache only (e.g. read-only working directory)
+                print(f"Disk cache disabled ({CACHE_DB}): {e}", file=sys.stderr)
+                if _db is not None:
+                    _db.close()
+                _db = None
+
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            headers=_default_headers,
+            timeout=30,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _LOOP = asyncio.new_event_loop()
+        threading.Thread(target=_LOOP.run_forever, name="hf-io", daemon=True).start()
+        atexit.register(_close_client)
+
+
+def _close_client() -> None:
+    asyncio.run_coroutine_threadsafe(_CLIENT.aclose(), _LOOP).result(timeout=5)
+
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    if _LOOP is None:
+        start_worker()
+    return asyncio.run_coroutine_threadsafe(coro, _LOOP).result()
+
+
+def cache_get(key: tuple[str, str]) -> dict | None:
+    """Return a cached estimate if present and not expired.
+
+    Called from request threads; the SQLite lookup blocks only the caller.
+    """
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at >= time.monotonic():
+                _cache.move_to_end(key)
+                return result
+            del _cache[key]
+
+    if _db is None:
+        return None
+    try:
+        with _db_lock:
+            row = _db.execute(
+                "SELECT ts, body FROM estimates WHERE model_id = ? AND revision = ?", key
+            ).fetchone()
+    except sqlite3.Error:
+        return None
+    if row is None:
+        return None
+    age = time.time() - row[0]
+    if age > CACHE_TTL:
+        return None
 
-def get_safetensor_metadata(client: httpx.Client, url: str) -> dict | None:
+    # Promote to the in-process cache for the rest of its lifetime
+    result = orjson.loads(row[1])
+    with _cache_lock:
+        _cache[key] = (time.monotonic() + CACHE_TTL - age, result)
+        while len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def cache_put(key: tuple[str, str], result: dict) -> None:
+    """Store an estimate, evicting the least recently used entry when full."""
+    with _cache_lock:
+        _cache[key] = (time.monotonic() + CACHE_TTL, result)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+
+    if _db is None:
+        return
+    try:
+        now = int(time.time())
+        with _db_lock:
+            _db.execute(
+                "INSERT OR REPLACE INTO estimates VALUES (?, ?, ?, ?)",
+                (*key, now, json_dumps(result)),
+            )
+            # Drop expired rows so the table stays bounded by the TTL
+            _db.execute("DELETE FROM estimates WHERE ts < ?", (now - CACHE_TTL,))
+    except sqlite3.Error:
+        pass  # The disk cache is best-effort
+
+
+async def get_safetensor_metadata(
+    client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore
+) -> dict | None:
     """Fetch safetensors header metadata via range request."""
     try:
-        # First get the header size (first 8 bytes)
-        resp = client.get(url, headers={"Range": "bytes=0-7"})
-        if resp.status_code not in (200, 206):
-            return None
-        header_size = struct.unpack("<Q", resp.content)[0]
+        async with semaphore:
+            # Read the length prefix and (usually) the whole header in one request
+            resp = await client.get(url, headers={"Range": f"bytes=0-{HEADER_PREFETCH_BYTES - 1}"})
+            if resp.status_code not in (200, 206):
+                return None
+            data = resp.content
+            header_size = struct.unpack("<Q", data[:8])[0]
+            if len(data) >= 8 + header_size:
+                return orjson.loads(data[8:8 + header_size])
+
+            # Header is larger than the prefetch, fetch the rest of it
+            start, end = len(data), 8 + header_size
+            chunks = LARGE_HEADER_CHUNKS if header_size > LARGE_HEADER_BYTES else 1
+            step = -(-(end - start) // chunks)
+            resps = await asyncio.gather(*(
+                client.get(url, headers={"Range": f"bytes={a}-{min(a + step, end) - 1}"})
+                for a in range(start, end, step)
+            ))
+            if any(r.status_code != 206 for r in resps):
+                return None
+            return orjson.loads(b"".join([data[8:], *(r.content for r in resps)]))
+    except Exception:
+        return None
+
+
+async def get_file_listing(client: httpx.AsyncClient, model_id: str, revision: str) -> list | None:
+    """Fetch the repo file listing, reusing the cached copy on 304 Not Modified."""
+    key = (model_id, revision)
+    cached = _tree_cache.get(key)
+    headers = {"If-None-Match": cached[0]} if cached else None
+
+    api_url = f"https://huggingface.co/api/models/{model_id}/tree/{revision}"
+    resp = await client.get(api_url, headers=headers)
+    if resp.status_code == 304 and cached:
+        return cached[1]
+    if resp.status_code != 200:
+        return None
+
+    files = orjson.loads(resp.content)
+    etag = resp.headers.get("ETag")
+    if etag:
+        _tree_cache.pop(key, None)
+        _tree_cache[key] = (etag, files)
+        if len(_tree_cache) > CACHE_MAXSIZE:
+            del _tree_cache[next(iter(_tree_cache))]
+    return files
+
 
-        # Now fetch the actual header
-        resp = client.get(url, headers={"Range": f"bytes=8-{8 + header_size - 1}"})
-        if resp.status_code not in (200, 206):
+async def get_config(client: httpx.AsyncClient, model_id: str, revision: str) -> dict | None:
+    """Fetch the model's config.json, or None if missing or unreadable."""
+    try:
+        resp = await client.get(f"https://huggingface.co/{model_id}/resolve/{revision}/config.json")
+        if resp.status_code != 200:
             return None
-        return json.loads(resp.content)
+        config = orjson.loads(resp.content)
+        return config if isinstance(config, dict) else None
     except Exception:
         return None
 
 
+def estimate_params_from_config(config: dict) -> int | None:
+    """Approximate the parameter count of a dense transformer from its config.
+
+    Counts embeddings plus per-layer attention and MLP weights (biases and
+    norms are ignored). Returns None for quantized checkpoints and for
+    architectures outside CONFIG_ARCHITECTURES.
+    """
+    if "quantization_config" in config:
+        return None
+    architectures = config.get("architectures") or []
+    if len(architectures) != 1 or architectures[0] not in CONFIG_ARCHITECTURES:
+        return None
+
+    d = config.get("hidden_size")
+    layers = config.get("num_hidden_layers")
+    vocab = config.get("vocab_size")
+    if not all(isinstance(v, int) and v > 0 for v in (d, layers, vocab)):
+        return None
+
+    heads = config.get("num_attention_heads") or 1
+    kv_heads = config.get("num_key_value_heads") or heads
+    head_dim = config.get("head_dim") or d // heads
+    ff = config.get("intermediate_size") or 4 * d
+
+    attn = 2 * d * heads * head_dim + 2 * d * kv_heads * head_dim
+    mlp = CONFIG_ARCHITECTURES[architectures[0]] * d * ff
+    embed = vocab * d * (1 if config.get("tie_word_embeddings", True) else 2)
+    return layers * (attn + mlp) + embed
+
+
 def estimate_memory(model_id: str, revision: str = "main") -> dict:
-    """Estimate VRAM requirements for a HuggingFace model."""
+    """Estimate VRAM requirements for a HuggingFace model.
+
+    Runs on the calling (request) thread: the cache is checked and filled
+    here, and only the HuggingFace fetch runs on the shared event loop.
+    """
     # Validate model_id format
     if not model_id or "/" not in model_id:
         return {"error": "Invalid model ID. Expected format: owner/model-name"}
 
     # Sanitize model_id (basic protection)
     model_id = model_id.strip()
-    if any(c in model_id for c in ["<", ">", '"', "'", ";", "&", "|"]):
+    if _BAD_MODEL_CHARS.search(model_id):
         return {"error": "Invalid characters in model ID"}
 
-    headers = {"Accept": "application/json"}
-    if HF_TOKEN:
-        headers["Authorization"] = f"Bearer {HF_TOKEN}"
-
+    key = (model_id, revision)
+    result = cache_get(key)
+    if result is None:
+        result = run_async(fetch_estimate(model_id, revision))
+        # Only successful lookups are cached; errors are often transient
+        if "error" not in result:
+            cache_put(key, result)
+    return result
+
+
+def tally_tensors(metas: list[dict | None]) -> tuple[int, int, Counter]:
+    """Sum parameters and bytes (total and per dtype) over safetensors headers."""
+    dtype_counts = Counter()
+
+    # Only the per-dtype parameter count is accumulated per tensor;
+    # totals are derived once per dtype afterwards
+    for meta in metas:
+        if not meta:
+            continue
+
+        for key, tensor_info in meta.items():
+            if key == "__metadata__":
+                continue
+            dtype_counts[tensor_info.get("dtype", "F32")] += prod(tensor_info.get("shape", ()))
+
+    total_params = sum(dtype_counts.values())
+    total_bytes = sum(params * DTYPE_SIZES.get(dtype, 4) for dtype, params in dtype_counts.items())
+    return total_params, total_bytes, dtype_counts
+
+
+def fmt_size(bytes_val: float) -> str:
+    if bytes_val >= 1024**3:
+        return f"{bytes_val / (1024**3):.2f} GB"
+    return f"{bytes_val / (1024**2):.2f} MB"
+
+
+def fmt_params(p: int) -> str:
+    if p >= 1e9:
+        return f"{p / 1e9:.2f}B"
+    return f"{p / 1e6:.2f}M"
+
+
+def format_estimate(
+    model_id: str, total_params: int, total_bytes: int, current_dtype: str, approximate: bool = False
+) -> dict:
+    """Build the API response for a model's parameter and byte totals."""
+    result = {
+        "model": model_id,
+        "total_parameters": fmt_params(total_params),
+        "memory_required": fmt_size(total_bytes),
+        "current_dtype": current_dtype,
+        "recommended_vram": fmt_size(total_bytes * 1.2),
+        "other_precisions": {
+            "fp32": fmt_size(total_params * 4),
+            "fp16": fmt_size(total_params * 2),
+            "int8": fmt_size(total_params * 1),
+            "int4": fmt_size(total_params * 0.5),
+        },
+        "overhead_note": "Includes 20% for activations/KV cache (2K context)",
+    }
+    if approximate:
+        result["approximate"] = True
+    return result
+
+
+async def fetch_estimate(model_id: str, revision: str) -> dict:
+    """Compute the estimate from HuggingFace metadata (uncached)."""
+    client = _CLIENT
     try:
-        with httpx.Client(http2=True, headers=headers, timeout=30, follow_redirects=True) as client:
-            # Get file listing
-            api_url = f"https://huggingface.co/api/models/{model_id}/tree/{revision}"
-            resp = client.get(api_url)
-            if resp.status_code != 200:
-                return {"error": f"Model not found or inaccessible: {model_id}"}
-
-            files = resp.json()
-            safetensor_files = [f for f in files if f["path"].endswith(".safetensors")]
-
-            if not safetensor_files:
-                return {"error": "No safetensors files found in model"}
-
-            # Check for index file (sharded models)
-            index_files = [f for f in files if f["path"].endswith("model.safetensors.index.json")]
-            if index_files:
-                idx_url = f"https://huggingface.co/{model_id}/resolve/{revision}/{index_files[0]['path']}"
-                idx_resp = client.get(idx_url)
-                if idx_resp.status_code == 200:
-                    idx_data = idx_resp.json()
-                    shard_files = list(set(idx_data.get("weight_map", {}).values()))
-                    safetensor_files = [f for f in files if f["path"] in shard_files]
-
-            # Calculate total memory from all safetensor files
-            total_params = 0
-            total_bytes = 0
-            dtype_counts = {}
-
-            for sf in safetensor_files:
-                url = f"https://huggingface.co/{model_id}/resolve/{revision}/{sf['path']}"
-                meta = get_safetensor_metadata(client, url)
-                if not meta:
-                    continue
-
-                for key, tensor_info in meta.items():
-                    if key == "__metadata__":
-                        continue
-                    dtype = tensor_info.get("dtype", "F32")
-                    shape = tensor_info.get("shape", [])
-                    params = 1
-                    for dim in shape:
-                        params *= dim
-                    total_params += params
-                    byte_size = DTYPE_SIZES.get(dtype, 4)
-                    total_bytes += params * byte_size
-                    dtype_counts[dtype] = dtype_counts.get(dtype, 0) + params
-
-            if total_params == 0:
-                return {"error": "Could not parse model metadata"}
-
-            def fmt_size(bytes_val: float) -> str:
-                if bytes_val >= 1024**3:
-                    return f"{bytes_val / (1024**3):.2f} GB"
-                return f"{bytes_val / (1024**2):.2f} MB"
-
-            def fmt_params(p: int) -> str:
-                if p >= 1e9:
-                    return f"{p / 1e9:.2f}B"
-                return f"{p / 1e6:.2f}M"
-
-            return {
-                "model": model_id,
-                "total_parameters": fmt_params(total_params),
-                "memory_required": fmt_size(total_bytes),
-                "current_dtype": max(dtype_counts, key=dtype_counts.get),
-                "recommended_vram": fmt_size(total_bytes * 1.2),
-                "other_precisions": {
-                    "fp32": fmt_size(total_params * 4),
-                    "fp16": fmt_size(total_params * 2),
-                    "int8": fmt_size(total_params * 1),
-                    "int4": fmt_size(total_params * 0.5),
-                },
-                "overhead_note": "Includes 20% for activations/KV cache (2K context)",
-            }
+        # Get file listing and config together
+        files, config = await asyncio.gather(
+            get_file_listing(client, model_id, revision),
+            get_config(client, model_id, revision),
+        )
+        if files is None:
+            return {"error": f"Model not found or inaccessible: {model_id}"}
+
+        # Single pass over the listing: weight files (indexed by path) and the shard index
+        safetensor_files = []
+        path_to_file = {}
+        index_files = []
+        bin_files = []
+        for f in files:
+            path = f["path"]
+            if path.endswith(".safetensors"):
+                safetensor_files.append(f)
+                path_to_file[path] = f
+            elif path.endswith("model.safetensors.index.json"):
+                index_files.append(f)
+            elif path.endswith(".bin") and path.rpartition("/")[2].startswith("pytorch_model"):
+                bin_files.append(f)
+
+        # Standard dense architectures can be sized from config.json alone,
+        # as long as the repo actually ships weights in a format we read
+        config = config or {}
+        config_dtype = TORCH_DTYPES.get(config.get("torch_dtype") or config.get("dtype"))
+        if config_dtype and (safetensor_files or bin_files):
+            total_params = estimate_params_from_config(config)
+            if total_params:
+                total_bytes = total_params * DTYPE_SIZES[config_dtype]
+                return format_estimate(model_id, total_params, total_bytes, config_dtype, approximate=True)
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        def shard_url(sf: dict) -> str:
+            return f"https://huggingface.co/{model_id}/resolve/{revision}/{sf['path']}"
+
+        # PyTorch-only repos: size the .bin shards from the listing and assume
+        # the config dtype (or F32) for every parameter
+        if not safetensor_files and bin_files:
+            if not all(bf.get("size") for bf in bin_files):
+                return {"error": "Could not determine the size of the PyTorch weight files"}
+            total_bytes = sum(bf["size"] for bf in bin_files)
+            dtype = config_dtype or "F32"
+            total_params = total_bytes // DTYPE_SIZES[dtype]
+            return format_estimate(model_id, total_params, total_bytes, dtype, approximate=True)
+
+        if not safetensor_files:
+            return {"error": "No safetensors files found in model"}
+
+        # Check for index file (sharded models)
+        index_total_size = None
+        if index_files:
+            idx_url = f"https://huggingface.co/{model_id}/resolve/{revision}/{index_files[0]['path']}"
+            idx_resp = await client.get(idx_url)
+            if idx_resp.status_code == 200:
+                idx_data = orjson.loads(idx_resp.content)
+                shard_files = sorted(set(idx_data.get("weight_map", {}).values()))
+                safetensor_files = [path_to_file[p] for p in shard_files if p in path_to_file]
+                index_total_size = (idx_data.get("metadata") or {}).get("total_size")
+
+        # With a byte total for all shards, a few sampled headers sharing a single
+        # dtype give the bytes per parameter and the other shards can be skipped.
+        # Mixed-precision samples aren't representative, so those fall through
+        # to every header.
+        shards_total_bytes = None
+        if len(safetensor_files) > 1:
+            if index_total_size:
+                shards_total_bytes = int(index_total_size)
+            elif all(sf.get("size") for sf in safetensor_files):
+                # Summed file sizes also count each shard's header
+                shards_total_bytes = sum(sf["size"] for sf in safetensor_files)
+
+        if shards_total_bytes:
+            n = len(safetensor_files)
+            samples = [safetensor_files[i] for i in sorted({0, n // 2, n - 1})]
+            metas = await asyncio.gather(*(
+                get_safetensor_metadata(client, shard_url(sf), semaphore) for sf in samples
+            ))
+            sample_dtypes = [set(tally_tensors([meta])[2]) for meta in metas]
+            if len(sample_dtypes[0]) == 1 and all(d == sample_dtypes[0] for d in sample_dtypes):
+                current_dtype = next(iter(sample_dtypes[0]))
+                total_params = shards_total_bytes // DTYPE_SIZES.get(current_dtype, 4)
+                return format_estimate(
+                    model_id, total_params, shards_total_bytes, current_dtype, approximate=True
+                )
+
+        # Fetch all shard headers concurrently
+        metas = await asyncio.gather(*(
+            get_safetensor_metadata(client, shard_url(sf), semaphore)
+            for sf in safetensor_files
+        ))
+
+        # A partial sum would be cached as if it were the whole model
+        missing = sum(meta is None for meta in metas)
+        if missing:
+            return {"error": f"Could not read metadata for {missing} of {len(metas)} shards. Try again."}
+
+        # Calculate total memory from all safetensor files
+        total_params, total_bytes, dtype_counts = tally_tensors(metas)
+        if total_params == 0:
+            return {"error": "Could not parse model metadata"}
+
+        return format_estimate(model_id, total_params, total_bytes, max(dtype_counts, key=dtype_counts.get))
     except httpx.TimeoutException:
         return {"error": "Request to HuggingFace timed out. Try again."}
     except Exception as e:
@@ -147,10 +506,29 @@ class Handler(BaseHTTPRequestHandler):
         pass
 
     def _json(self, data: dict, status: int = 200):
+        self._send(json_dumps(data), status)
+
+    def _accepts_gzip(self) -> bool:
+        for coding in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = coding.partition(";")
+            if name.strip().lower() == "gzip":
+                _, _, q = params.partition("q=")
+                try:
+                    return float(q or 1) > 0
+                except ValueError:
+                    return True
+        return False
+
+    def _send(self, body: bytes, status: int):
         try:
-            body = json.dumps(data, indent=2).encode()
+            gzipped = len(body) >= GZIP_MIN_BYTES and self._accepts_gzip()
+            if gzipped:
+                body = gzip.compress(body, compresslevel=1)
             self.send_response(status)
             self.send_header("Content-Type", "application/json")
+            if gzipped:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept-Encoding")
             self.send_header("Content-Length", len(body))
             self.send_header("Access-Control-Allow-Origin", "*")
             self.end_headers()
@@ -171,11 +549,65 @@ class Handler(BaseHTTPRequestHandler):
                 status = 500 if "error" in result else 200
                 return self._json(result, status)
 
-            self._json({"error": "Usage: /model?hf_id=microsoft/phi-2"}, 400)
+            self._send(USAGE_BODY, 400)
         except Exception:
             pass  # Catch-all to prevent server crash
 
 
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    """Threaded server whose port can be bound by several worker processes."""
+
+    allow_reuse_port = True
+
+
+def serve(server_class: type[ThreadingHTTPServer]) -> None:
+    start_worker()
+    server_class(("", PORT), Handler).serve_forever()
+
+
+def spawn_worker() -> int:
+    """Fork a worker process serving on the shared port; return its pid."""
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            serve(ReusePortHTTPServer)
+        except KeyboardInterrupt:
+            pass
+        except BaseException:
+            traceback.print_exc()
+        os._exit(1)
+    return pid
+
+
+def supervise(workers: int) -> None:
+    """Keep `workers` worker processes running; on SIGTERM, stop them and return."""
+    children = {spawn_worker() for _ in range(workers)}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    while children:
+        pid, _ = os.wait()
+        children.discard(pid)
+        if not stopping:
+            time.sleep(1)  # Don't spin if workers die right after starting
+            children.add(spawn_worker())
+
+
 if __name__ == "__main__":
     print(f"vram.io | http://localhost:{PORT}/model?hf_id=<model>")
-    HTTPServer(("", PORT), Handler).serve_forever()
+
+    # Fork workers that each bind the port; the kernel spreads connections across them
+    if WORKERS > 1 and hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT"):
+        supervise(WORKERS)
+    else:
+        serve(ThreadingHTTPServer)